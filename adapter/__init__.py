@@ -11,63 +11,58 @@ This package provides:
 - Normalization layer for consistent data transformation
 """
 
+from importlib import import_module
+
 __version__ = "0.1.0"
 
-# Phase 1: Ingestion & Parsing
-from .ingestion import OpenAPILoader, BaseLoader
-from .parsing import Normalizer, CanonicalEndpoint, CanonicalParameter, CanonicalSchema
+# Public names are resolved lazily (PEP 562): `import adapter` stays cheap
+# because heavy dependencies (yaml, requests, pydantic) are only imported
+# when the phase that needs them is first touched. Submodule imports like
+# `from adapter.runtime import APIExecutor` are unaffected.
+_EXPORTS = {
+    # Phase 1: Ingestion & Parsing
+    "OpenAPILoader": ".ingestion",
+    "BaseLoader": ".ingestion",
+    "Normalizer": ".parsing",
+    "CanonicalEndpoint": ".parsing",
+    "CanonicalParameter": ".parsing",
+    "CanonicalSchema": ".parsing",
+    # Phase 2: MCP Tools
+    "ToolGenerator": ".mcp",
+    "ToolRegistry": ".mcp",
+    "MCPTool": ".mcp",
+    "SchemaConverter": ".mcp",
+    # Phase 3: Runtime Execution
+    "APIExecutor": ".runtime",
+    "RequestBuilder": ".runtime",
+    "ResponseProcessor": ".runtime",
+    "AuthHandler": ".runtime",
+    "NoAuth": ".runtime",
+    "APIKeyAuth": ".runtime",
+    "BearerAuth": ".runtime",
+    "BasicAuth": ".runtime",
+    "OAuth2Auth": ".runtime",
+    "ExecutionResult": ".runtime",
+    "ProcessedResponse": ".runtime",
+    # Phase 4: MCP Server
+    "MCPServer": ".server",
+    "ToolProvider": ".server",
+    "ExecutionHandler": ".server",
+    "StdioTransport": ".server",
+}
+
+__all__ = ["__version__"] + list(_EXPORTS)
 
-# Phase 2: MCP Tools
-from .mcp import ToolGenerator, ToolRegistry, MCPTool, SchemaConverter
 
-# Phase 3: Runtime Execution
-from .runtime import (
-    APIExecutor,
-    RequestBuilder,
-    ResponseProcessor,
-    AuthHandler,
-    NoAuth,
-    APIKeyAuth,
-    BearerAuth,
-    BasicAuth,
-    OAuth2Auth,
-    ExecutionResult,
-    ProcessedResponse,
-)
+def __getattr__(name: str):
+    """Resolve public names on first access and cache them on the package."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Phase 4: MCP Server
-from .server import MCPServer, ToolProvider, ExecutionHandler, StdioTransport
 
-__all__ = [
-    # Version
-    "__version__",
-    # Phase 1
-    "OpenAPILoader",
-    "BaseLoader",
-    "Normalizer",
-    "CanonicalEndpoint",
-    "CanonicalParameter",
-    "CanonicalSchema",
-    # Phase 2
-    "ToolGenerator",
-    "ToolRegistry",
-    "MCPTool",
-    "SchemaConverter",
-    # Phase 3
-    "APIExecutor",
-    "RequestBuilder",
-    "ResponseProcessor",
-    "AuthHandler",
-    "NoAuth",
-    "APIKeyAuth",
-    "BearerAuth",
-    "BasicAuth",
-    "OAuth2Auth",
-    "ExecutionResult",
-    "ProcessedResponse",
-    # Phase 4
-    "MCPServer",
-    "ToolProvider",
-    "ExecutionHandler",
-    "StdioTransport",
-]
+def __dir__():
+    return sorted(__all__)
@@ -9,6 +9,7 @@ Available loaders:
 """
 
 from .base_loader import BaseLoader, LoaderError, InvalidFormatError, ValidationError
+from .cache import SpecCache
 from .loader_openapi import OpenAPILoader
 
 __all__ = [
@@ -17,4 +18,5 @@ __all__ = [
     "InvalidFormatError",
     "ValidationError",
     "OpenAPILoader",
+    "SpecCache",
 ]
@@ -0,0 +1,163 @@
+"""
+On-disk cache for parsed OpenAPI specifications.
+
+Parsing a multi-MB YAML spec dominates loader startup time. This module
+provides a small persistent cache so repeated loads of the same content
+(e.g. CLI invocations against the same API) skip parsing entirely.
+
+Cache entries are keyed by (package version, content hash) so a library
+upgrade never serves stale results, and entries untouched for longer than
+the configured max age are swept on initialization.
+
+Design notes:
+- Opt-in: loaders only consult the cache when explicitly enabled
+- Stores the fully dereferenced spec dict via pickle (protocol 5)
+- Corrupt or unreadable entries are treated as cache misses
+"""
+
+import hashlib
+import logging
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location follows the XDG-style per-user cache convention
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "rest-to-mcp-adapter"
+
+# Entries not read for this many days are removed on startup
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+def _package_version() -> str:
+    """Get the adapter package version (imported lazily to avoid cycles)."""
+    from .. import __version__
+
+    return __version__
+
+
+class SpecCache:
+    """
+    Persistent cache for parsed OpenAPI spec dictionaries.
+
+    Entries are stored as pickle files under a version-specific directory,
+    named by a blake2b hash of the raw spec content.
+
+    Examples:
+        >>> cache = SpecCache()
+        >>> spec = cache.get(content)
+        >>> if spec is None:
+        ...     spec = expensive_parse(content)
+        ...     cache.set(content, spec)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+    ):
+        """
+        Initialize the spec cache.
+
+        Args:
+            cache_dir: Base cache directory (default: ~/.cache/rest-to-mcp-adapter)
+            max_age_days: Entries untouched for longer are swept on init
+        """
+        base_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir = base_dir / _package_version()
+        self.max_age_days = max_age_days
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._sweep_stale_entries()
+            self._available = True
+        except OSError as e:
+            # Read-only filesystem, permission issues, etc. - degrade to no-op
+            logger.debug("Spec cache unavailable: %s", e)
+            self._available = False
+
+    def get(self, content: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a parsed spec by its raw content.
+
+        Args:
+            content: Raw spec content string
+
+        Returns:
+            Cached spec dictionary, or None on miss
+        """
+        if not self._available:
+            return None
+
+        path = self._path_for(content)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                spec = pickle.load(f)
+            # Refresh mtime so frequently used entries survive sweeps
+            path.touch()
+            return spec
+        except (OSError, pickle.PickleError, EOFError) as e:
+            logger.debug("Discarding unreadable cache entry %s: %s", path.name, e)
+            self._discard(path)
+            return None
+
+    def set(self, content: str, spec: Dict[str, Any]) -> None:
+        """
+        Store a parsed spec keyed by its raw content.
+
+        Args:
+            content: Raw spec content string
+            spec: Parsed (and dereferenced) spec dictionary
+        """
+        if not self._available:
+            return
+
+        path = self._path_for(content)
+        try:
+            with open(path, "wb") as f:
+                pickle.dump(spec, f, protocol=5)
+        except (OSError, pickle.PickleError) as e:
+            logger.debug("Failed to write cache entry %s: %s", path.name, e)
+            self._discard(path)
+
+    def clear(self) -> None:
+        """Remove all entries for the current package version."""
+        if not self._available:
+            return
+
+        for path in self.cache_dir.glob("*.pkl"):
+            self._discard(path)
+
+    def _path_for(self, content: str) -> Path:
+        """Compute the cache file path for the given content."""
+        digest = hashlib.blake2b(
+            content.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def _sweep_stale_entries(self) -> None:
+        """Remove entries older than max_age_days (based on mtime)."""
+        cutoff = time.time() - self.max_age_days * 86400
+
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        """Best-effort removal of a cache file."""
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"SpecCache(cache_dir='{self.cache_dir}')"
@@ -18,15 +18,179 @@ Design notes:
 - Returns structured dict ready for normalization
 """
 
+import functools
+import hashlib
 import json
+import re
 from pathlib import Path
 from typing import Any, Dict, Union
 from urllib.parse import urlparse
 
-import yaml
-
 from .base_loader import BaseLoader, InvalidFormatError, ValidationError
 
+try:
+    # Optional C-accelerated JSON parser, several times faster than stdlib
+    # on large specs. Install with the 'speed' extra.
+    import orjson
+except ImportError:
+    orjson = None
+
+@functools.lru_cache(maxsize=None)
+def _openapi_spec_cls():
+    """
+    Resolve LangChain's OpenAPISpec class once.
+
+    Caching avoids re-running the import machinery on every load() - and,
+    when langchain-community is not installed, avoids a repeated (slow)
+    failing sys.path search per call.
+
+    Returns:
+        The OpenAPISpec class, or None if langchain-community is absent
+    """
+    try:
+        from langchain_community.utilities.openapi import OpenAPISpec
+    except ImportError:
+        return None
+
+    return OpenAPISpec
+
+
+def _first_nonspace_char(content: str) -> str:
+    """
+    Return the first non-whitespace character of content ('' if none).
+
+    Used for JSON-vs-YAML dispatch without allocating a stripped copy of a
+    potentially multi-MB document.
+    """
+    for ch in content:
+        if not ch.isspace():
+            return ch
+    return ""
+
+
+# Version-marker prescan for validate(): an 'openapi'/'swagger' key near the
+# head of the document - quoted (JSON) or at the start of a line (YAML) - is
+# definitive, so validate() can accept without parsing the whole spec
+_SPEC_MARKER_RE = re.compile(
+    r'["\'](?:openapi|swagger)["\']\s*:'  # JSON / quoted YAML key
+    r'|^(?:openapi|swagger)\s*:',          # unquoted top-level YAML key
+    re.MULTILINE,
+)
+
+def _resolve_ref(ref_path: str, root: Dict[str, Any], visited: set) -> Any:
+    """
+    Resolve a JSON Pointer reference like '#/components/parameters/timestamp'.
+
+    Module-level (rather than a closure rebuilt per _dereference_spec call)
+    so the recursive walk creates no function objects or cell lookups.
+
+    Args:
+        ref_path: The $ref path to resolve
+        root: The root spec document
+        visited: References on the current resolution stack
+
+    Returns:
+        The resolved definition
+
+    Raises:
+        ValueError: If reference cannot be resolved
+    """
+    # Check for circular reference
+    if ref_path in visited:
+        raise ValueError(f"Circular reference detected: {ref_path}")
+
+    visited.add(ref_path)
+
+    # Only handle internal references (starting with #/)
+    if not ref_path.startswith("#/"):
+        # External references not supported yet
+        return {"$ref": ref_path}
+
+    # Parse the path (e.g., "#/components/parameters/timestamp")
+    # Remove the leading '#/'
+    path_parts = ref_path[2:].split("/")
+
+    # Navigate through the spec to find the definition
+    current = root
+    for part in path_parts:
+        # Handle escaped characters in JSON Pointer
+        part = part.replace("~1", "/").replace("~0", "~")
+
+        if isinstance(current, dict):
+            if part not in current:
+                raise ValueError(f"Reference not found: {ref_path} (missing key: {part})")
+            current = current[part]
+        elif isinstance(current, list):
+            try:
+                index = int(part)
+                current = current[index]
+            except (ValueError, IndexError):
+                raise ValueError(f"Invalid array reference: {ref_path} (index: {part})")
+        else:
+            raise ValueError(f"Cannot navigate through {type(current)} at {ref_path}")
+
+    # Recursively dereference the resolved definition
+    resolved = _dereference_value(current, root, visited)
+
+    visited.remove(ref_path)
+    return resolved
+
+
+def _dereference_value(value: Any, root: Dict[str, Any], visited: set) -> Any:
+    """
+    Recursively dereference a value.
+
+    Args:
+        value: The value to dereference (can be dict, list, or primitive)
+        root: The root spec document
+        visited: References on the current resolution stack
+
+    Returns:
+        The dereferenced value
+    """
+    if isinstance(value, dict):
+        # Check if this is a $ref object
+        if "$ref" in value and len(value) == 1:
+            # This is a pure reference, resolve it
+            return _resolve_ref(value["$ref"], root, visited)
+        elif "$ref" in value:
+            # This is a reference with additional properties (allOf pattern)
+            # Resolve the reference and merge with other properties
+            ref_resolved = _resolve_ref(value["$ref"], root, visited)
+            result = {}
+
+            # Start with resolved reference
+            if isinstance(ref_resolved, dict):
+                result.update(ref_resolved)
+
+            # Override with local properties (excluding $ref)
+            for key, val in value.items():
+                if key != "$ref":
+                    result[key] = _dereference_value(val, root, visited)
+
+            return result
+        else:
+            # Regular dict, recursively dereference all values
+            return {
+                key: _dereference_value(val, root, visited)
+                for key, val in value.items()
+            }
+
+    elif isinstance(value, list):
+        # Recursively dereference all items
+        return [_dereference_value(item, root, visited) for item in value]
+
+    else:
+        # Primitive value, return as-is
+        return value
+
+
+# Cache of validate() outcomes keyed by content hash. The same spec is often
+# validated repeatedly (e.g. re-fetched URLs, retries), and hashing the
+# content is orders of magnitude cheaper than re-parsing it.
+_VALIDATE_CACHE: Dict[bytes, bool] = {}
+_VALIDATE_CACHE_MAX = 128
+
 
 class OpenAPILoader(BaseLoader):
     """
@@ -64,16 +228,30 @@ class OpenAPILoader(BaseLoader):
         >>> spec = loader.load(malformed_spec)  # Raises ValidationError
     """
 
-    def __init__(self, strict: bool = False, use_langchain: bool = True):
+    def __init__(
+        self,
+        strict: bool = False,
+        use_langchain: bool = True,
+        use_cache: bool = False,
+    ):
         """
         Initialize the OpenAPI loader.
 
         Args:
             strict: If True, enforce strict validation (default: False)
             use_langchain: If True, prefer LangChain utilities (default: True)
+            use_cache: If True, cache parsed specs on disk so repeated loads
+                      of identical content skip parsing (default: False)
         """
         self.strict = strict
         self.use_langchain = use_langchain
+        self.use_cache = use_cache
+        self._spec_cache = None
+
+        if use_cache:
+            from .cache import SpecCache
+
+            self._spec_cache = SpecCache()
 
     def load_from_url(self, url: str) -> Dict[str, Any]:
         """
@@ -221,12 +399,27 @@ class OpenAPILoader(BaseLoader):
             InvalidFormatError: If content is not valid OpenAPI/Swagger
             ValidationError: If strict=True and spec is malformed
         """
-        if not self.validate(content):
+        if not content or not _first_nonspace_char(content):
             raise InvalidFormatError("Content appears to be empty or invalid")
 
-        # Parse the content (JSON or YAML)
+        # Check the on-disk cache before parsing
+        if self._spec_cache is not None:
+            cached_spec = self._spec_cache.get(content)
+            if cached_spec is not None:
+                return cached_spec
+
+        # Parse the content (JSON or YAML) exactly once. Parse success plus
+        # the marker check below covers everything validate() would reject,
+        # without the old validate()-then-parse double parse.
         spec_dict = self._parse_content(content)
 
+        if not (
+            "openapi" in spec_dict
+            or "swagger" in spec_dict
+            or "paths" in spec_dict
+        ):
+            raise InvalidFormatError("Content appears to be empty or invalid")
+
         # Try LangChain integration first if enabled
         if self.use_langchain:
             try:
@@ -245,6 +438,10 @@ class OpenAPILoader(BaseLoader):
         # Validate the spec structure
         self._validate_spec(spec_dict)
 
+        # Store the fully processed spec for future loads
+        if self._spec_cache is not None:
+            self._spec_cache.set(content, spec_dict)
+
         return spec_dict
 
     def _parse_content(self, content: str) -> Dict[str, Any]:
@@ -260,18 +457,29 @@ class OpenAPILoader(BaseLoader):
         Raises:
             InvalidFormatError: If content cannot be parsed
         """
-        content_stripped = content.strip()
+        # Dispatch on the first non-whitespace character rather than
+        # allocating a stripped copy of the whole document
 
         # Try JSON first (faster)
-        if content_stripped.startswith("{"):
+        if _first_nonspace_char(content) == "{":
             try:
+                if orjson is not None:
+                    return orjson.loads(content)
                 return json.loads(content)
-            except json.JSONDecodeError as e:
+            except ValueError as e:
+                # Covers json.JSONDecodeError and orjson.JSONDecodeError
                 raise InvalidFormatError(f"Invalid JSON: {e}")
 
-        # Try YAML
+        # Try YAML. PyYAML is imported lazily here: the import costs tens of
+        # milliseconds (C extension load) and JSON-only users never need it.
+        import yaml
+
         try:
-            data = yaml.safe_load(content)
+            # Prefer the libyaml C extension when PyYAML was built with it -
+            # same safe semantics as SafeLoader, roughly 10x faster
+            data = yaml.load(
+                content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            )
             if not isinstance(data, dict):
                 raise InvalidFormatError(
                     f"Expected dict, got {type(data).__name__}"
@@ -295,23 +503,21 @@ class OpenAPILoader(BaseLoader):
         Raises:
             ImportError: If LangChain is not installed
         """
-        try:
-            from langchain_community.utilities.openapi import OpenAPISpec
-
-            # Create OpenAPISpec instance from dict
-            # Note: OpenAPISpec expects the spec as a dict
-            openapi_spec = OpenAPISpec.from_spec_dict(spec_dict)
-
-            # Return the underlying spec dict
-            # OpenAPISpec provides validation and normalization
-            return openapi_spec.spec_dict
-
-        except ImportError:
+        spec_cls = _openapi_spec_cls()
+        if spec_cls is None:
             raise ImportError(
                 "LangChain not available. Install with: "
                 "uv add langchain-community"
             )
 
+        # Create OpenAPISpec instance from dict
+        # Note: OpenAPISpec expects the spec as a dict
+        openapi_spec = spec_cls.from_spec_dict(spec_dict)
+
+        # Return the underlying spec dict
+        # OpenAPISpec provides validation and normalization
+        return openapi_spec.spec_dict
+
     def _dereference_spec(self, spec: Dict[str, Any]) -> Dict[str, Any]:
         """
         Dereference all $ref pointers in the OpenAPI spec.
@@ -329,110 +535,10 @@ class OpenAPILoader(BaseLoader):
             >>> # Before: {'$ref': '#/components/parameters/timestamp'}
             >>> # After: {'name': 'timestamp', 'in': 'query', 'type': 'integer', ...}
         """
-        # Track visited references to detect circular references
-        visited = set()
-
-        def resolve_ref(ref_path: str, root: Dict[str, Any]) -> Any:
-            """
-            Resolve a JSON Pointer reference like '#/components/parameters/timestamp'.
-
-            Args:
-                ref_path: The $ref path to resolve
-                root: The root spec document
-
-            Returns:
-                The resolved definition
-
-            Raises:
-                ValueError: If reference cannot be resolved
-            """
-            # Check for circular reference
-            if ref_path in visited:
-                raise ValueError(f"Circular reference detected: {ref_path}")
-
-            visited.add(ref_path)
-
-            # Only handle internal references (starting with #/)
-            if not ref_path.startswith("#/"):
-                # External references not supported yet
-                return {"$ref": ref_path}
-
-            # Parse the path (e.g., "#/components/parameters/timestamp")
-            # Remove the leading '#/'
-            path_parts = ref_path[2:].split("/")
-
-            # Navigate through the spec to find the definition
-            current = root
-            for part in path_parts:
-                # Handle escaped characters in JSON Pointer
-                part = part.replace("~1", "/").replace("~0", "~")
-
-                if isinstance(current, dict):
-                    if part not in current:
-                        raise ValueError(f"Reference not found: {ref_path} (missing key: {part})")
-                    current = current[part]
-                elif isinstance(current, list):
-                    try:
-                        index = int(part)
-                        current = current[index]
-                    except (ValueError, IndexError):
-                        raise ValueError(f"Invalid array reference: {ref_path} (index: {part})")
-                else:
-                    raise ValueError(f"Cannot navigate through {type(current)} at {ref_path}")
-
-            # Recursively dereference the resolved definition
-            resolved = dereference_value(current, root)
-
-            visited.remove(ref_path)
-            return resolved
-
-        def dereference_value(value: Any, root: Dict[str, Any]) -> Any:
-            """
-            Recursively dereference a value.
-
-            Args:
-                value: The value to dereference (can be dict, list, or primitive)
-                root: The root spec document
-
-            Returns:
-                The dereferenced value
-            """
-            if isinstance(value, dict):
-                # Check if this is a $ref object
-                if "$ref" in value and len(value) == 1:
-                    # This is a pure reference, resolve it
-                    return resolve_ref(value["$ref"], root)
-                elif "$ref" in value:
-                    # This is a reference with additional properties (allOf pattern)
-                    # Resolve the reference and merge with other properties
-                    ref_resolved = resolve_ref(value["$ref"], root)
-                    result = {}
-
-                    # Start with resolved reference
-                    if isinstance(ref_resolved, dict):
-                        result.update(ref_resolved)
-
-                    # Override with local properties (excluding $ref)
-                    for key, val in value.items():
-                        if key != "$ref":
-                            result[key] = dereference_value(val, root)
-
-                    return result
-                else:
-                    # Regular dict, recursively dereference all values
-                    return {key: dereference_value(val, root) for key, val in value.items()}
-
-            elif isinstance(value, list):
-                # Recursively dereference all items
-                return [dereference_value(item, root) for item in value]
-
-            else:
-                # Primitive value, return as-is
-                return value
-
-        # Start dereferencing from the root
+        # Start dereferencing from the root; the visited set detects
+        # circular references
         try:
-            return dereference_value(spec, spec)
+            return _dereference_value(spec, spec, set())
         except Exception as e:
             # If dereferencing fails and we're in strict mode, raise
             if self.strict:
@@ -440,7 +546,7 @@ class OpenAPILoader(BaseLoader):
             # Otherwise, return original spec with a warning
             import logging
             logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to dereference spec: {e}. Continuing with partial dereferencing.")
+            logger.warning("Failed to dereference spec: %s. Continuing with partial dereferencing.", e)
             return spec
 
     def _validate_spec(self, spec_dict: Dict[str, Any]) -> None:
@@ -458,44 +564,36 @@ class OpenAPILoader(BaseLoader):
         if not isinstance(spec_dict, dict):
             raise ValidationError("Spec must be a dictionary")
 
-        # Check for version field
-        has_openapi = "openapi" in spec_dict
-        has_swagger = "swagger" in spec_dict
-
-        if not has_openapi and not has_swagger:
-            if self.strict:
+        # Version and paths checks only matter in strict mode
+        if self.strict:
+            if "openapi" not in spec_dict and "swagger" not in spec_dict:
                 raise ValidationError(
                     "Spec must contain 'openapi' or 'swagger' version field"
                 )
 
-        # Check for required fields
-        required_fields = ["info"]  # 'info' is required in both OpenAPI and Swagger
+            # 'paths' is technically required, but we allow it to be missing
+            # for partial/incomplete specs (common in documentation)
+            if "paths" not in spec_dict:
+                raise ValidationError("Spec must contain 'paths' field")
 
-        # 'paths' is technically required, but we allow it to be missing
-        # for partial/incomplete specs (common in documentation)
-        if self.strict and "paths" not in spec_dict:
-            raise ValidationError("Spec must contain 'paths' field")
-
-        for field in required_fields:
-            if field not in spec_dict:
-                if self.strict:
-                    raise ValidationError(f"Missing required field: {field}")
-                else:
-                    # Provide default for missing fields
-                    if field == "info":
-                        spec_dict["info"] = {"title": "Unknown API", "version": "1.0.0"}
-
-        # Validate info field structure
-        if "info" in spec_dict:
-            info = spec_dict["info"]
-            if not isinstance(info, dict):
-                raise ValidationError("'info' field must be a dictionary")
+        # 'info' is required in both OpenAPI and Swagger - read it once
+        info = spec_dict.get("info")
 
+        if info is None:
             if self.strict:
-                if "title" not in info:
-                    raise ValidationError("'info' must contain 'title'")
-                if "version" not in info:
-                    raise ValidationError("'info' must contain 'version'")
+                raise ValidationError("Missing required field: info")
+            # Provide default for the missing field
+            spec_dict["info"] = {"title": "Unknown API", "version": "1.0.0"}
+            return
+
+        if not isinstance(info, dict):
+            raise ValidationError("'info' field must be a dictionary")
+
+        if self.strict:
+            if "title" not in info:
+                raise ValidationError("'info' must contain 'title'")
+            if "version" not in info:
+                raise ValidationError("'info' must contain 'version'")
 
     def extract_auth_parameters(self, spec_dict: Dict[str, Any]) -> set:
         """
@@ -525,9 +623,10 @@ class OpenAPILoader(BaseLoader):
         """
         auth_params = set()
 
-        # OpenAPI 3.x: components.securitySchemes
-        if "components" in spec_dict and "securitySchemes" in spec_dict["components"]:
-            security_schemes = spec_dict["components"]["securitySchemes"]
+        # OpenAPI 3.x: components.securitySchemes (looked up once)
+        components = spec_dict.get("components")
+        if isinstance(components, dict) and "securitySchemes" in components:
+            security_schemes = components["securitySchemes"]
             auth_params.update(self._extract_from_security_schemes(security_schemes))
 
         # Swagger 2.x: securityDefinitions
@@ -593,21 +692,65 @@ class OpenAPILoader(BaseLoader):
         Returns:
             True if content appears to be valid OpenAPI/Swagger
         """
-        if not content or not content.strip():
+        first = _first_nonspace_char(content) if content else ""
+        if not first:
             return False
 
-        try:
-            spec_dict = self._parse_content(content)
+        # Markup (HTML/XML) can never parse as a spec - one-char early-out
+        # before any parser or scan touches the document
+        if first == "<":
+            return False
 
-            # Quick check for OpenAPI/Swagger markers
-            if "openapi" in spec_dict or "swagger" in spec_dict:
-                return True
+        # Cheap structural pre-check before invoking the YAML parser.
+        # Any spec this method would accept must contain one of these keys,
+        # so non-spec content (prose, config files, etc.) is rejected without
+        # paying for a full YAML parse of potentially multi-MB input.
+        if first != "{":
+            if not any(
+                marker in content for marker in ("openapi", "swagger", "paths")
+            ):
+                return False
+
+        # Check the content-hash cache before parsing
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cached = _VALIDATE_CACHE.get(digest)
+        if cached is not None:
+            return cached
+
+        result = False
+        skip_parse = False
+
+        # Fast accept: an openapi/swagger version key near the head is
+        # definitive, so a multi-MB spec need not be materialized into a
+        # full object graph just to be detected. The regex covers both
+        # quoted (JSON) and line-anchored unquoted (YAML) forms; a miss
+        # falls through to the full parse below.
+        if _SPEC_MARKER_RE.search(content[:16384]) is not None:
+            result = True
+            skip_parse = True
+
+        if not skip_parse:
+            try:
+                spec_dict = self._parse_content(content)
 
-            # Also accept if it has 'paths' (might be partial spec)
-            if "paths" in spec_dict:
-                return True
+                # Quick check for OpenAPI/Swagger markers
+                if "openapi" in spec_dict or "swagger" in spec_dict:
+                    result = True
 
-        except (InvalidFormatError, Exception):
-            return False
+                # Also accept if it has 'paths' (might be partial spec)
+                elif "paths" in spec_dict:
+                    result = True
+
+            except InvalidFormatError:
+                # _parse_content wraps all parser failures (json, orjson,
+                # yaml) in InvalidFormatError; anything else is a real bug
+                # and should propagate rather than be masked as "invalid"
+                result = False
+
+        # Bounded cache - evict oldest entry when full (dicts preserve
+        # insertion order, so this is a simple FIFO)
+        if len(_VALIDATE_CACHE) >= _VALIDATE_CACHE_MAX:
+            _VALIDATE_CACHE.pop(next(iter(_VALIDATE_CACHE)))
+        _VALIDATE_CACHE[digest] = result
 
-        return False
+        return result
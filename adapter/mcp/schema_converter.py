@@ -51,6 +51,21 @@ class SchemaConverter:
         }
     """
 
+    def __init__(self):
+        """Initialize the converter with an empty conversion cache."""
+        # Memoizes converted schemas by identity: a CanonicalSchema instance
+        # reused across endpoints (shared sub-schemas, repeated generate
+        # calls) converts once. The schema object itself is stored alongside
+        # the result so its id() cannot be recycled while cached.
+        self._schema_cache: Dict[int, Any] = {}
+        # Memoizes parameter property dicts by content: specs repeat the
+        # same handful of parameters (page, limit, api_key, ...) across
+        # endpoints, and equal parameters convert to equal property dicts.
+        self._property_cache: Dict[tuple, Dict[str, Any]] = {}
+
+    # Locations that get their own group in grouped schemas, in emit order
+    GROUPED_LOCATIONS = ("path", "query", "header", "body")
+
     # Map our canonical types to JSON Schema types
     TYPE_MAPPING = {
         DataType.STRING: "string",
@@ -96,17 +111,12 @@ class SchemaConverter:
 
         All parameters are at the same level in the schema.
         """
-        properties = {}
-        required = []
-
-        for param in parameters:
-            # Convert parameter to JSON Schema property
-            prop_schema = self._parameter_to_property(param)
-            properties[param.name] = prop_schema
+        # Local alias skips the per-iteration attribute lookup in what is
+        # the tightest loop of tool generation
+        to_property = self._parameter_to_property
 
-            # Track required parameters
-            if param.required:
-                required.append(param.name)
+        properties = {param.name: to_property(param) for param in parameters}
+        required = [param.name for param in parameters if param.required]
 
         schema = {
             "type": "object",
@@ -127,32 +137,43 @@ class SchemaConverter:
 
         Parameters are grouped by location (path, query, header, body).
         """
-        grouped = {
-            "path": [],
-            "query": [],
-            "header": [],
-            "body": [],
-        }
+        to_property = self._parameter_to_property
+
+        # Single pass: each parameter is converted and placed straight into
+        # its location's sub-schema, instead of bucketing into lists first
+        # and running a second per-bucket conversion pass
+        buckets: Dict[str, Dict[str, Any]] = {}
 
-        # Group parameters by location
         for param in parameters:
-            location = param.location.value if hasattr(param.location, 'value') else param.location
-            if location in grouped:
-                grouped[location].append(param)
+            # ParameterLocation is a str Enum, so members hash and compare
+            # equal to their plain string values - no hasattr/.value
+            # normalization needed before the membership test or dict keying
+            location = param.location
+            if location not in self.GROUPED_LOCATIONS:
+                continue
+
+            bucket = buckets.get(location)
+            if bucket is None:
+                bucket = buckets[location] = {
+                    "type": "object",
+                    "properties": {},
+                }
 
-        # Build schema with nested structure
+            bucket["properties"][param.name] = to_property(param)
+            if param.required:
+                bucket.setdefault("required", []).append(param.name)
+
+        # Emit locations in their canonical order, independent of the order
+        # parameters arrived in
         properties = {}
         required = []
-
-        for location, params in grouped.items():
-            if not params:
+        for location in self.GROUPED_LOCATIONS:
+            bucket = buckets.get(location)
+            if bucket is None:
                 continue
-
-            location_schema = self._parameters_flat_schema(params)
-            properties[location] = location_schema
-
-            # If any parameters in this location are required, mark location as required
-            if location_schema.get("required"):
+            properties[location] = bucket
+            # A location with any required parameter is itself required
+            if "required" in bucket:
                 required.append(location)
 
         schema = {
@@ -177,30 +198,51 @@ class SchemaConverter:
 
         Returns:
             JSON Schema property definition
+
+        Note:
+            Equal parameters share one cached dict - callers must not
+            mutate the result (same contract as the schema cache).
         """
-        # Get JSON Schema type
         param_type = parameter.type
-        if isinstance(param_type, DataType):
-            json_type = self.TYPE_MAPPING.get(param_type, "string")
-        else:
+        description = parameter.description
+        default = parameter.default
+        example = parameter.example
+
+        # Content-keyed memo: parameters like "page" or "api_key" recur
+        # across most endpoints of a spec and convert identically. Defaults
+        # and examples can be unhashable (lists/dicts from the spec), in
+        # which case we just convert without caching.
+        try:
+            key = (param_type, description, default, example)
+            cached = self._property_cache.get(key)
+        except TypeError:
+            key = None
+            cached = None
+        if cached is not None:
+            return cached
+
+        # Get JSON Schema type. DataType is a str Enum, so the mapping
+        # accepts both enum members and their plain string values with a
+        # single dict lookup - no isinstance dispatch in the hot loop.
+        json_type = self.TYPE_MAPPING.get(param_type)
+        if json_type is None:
             json_type = str(param_type)
 
-        # Build property schema
         prop = {
             "type": json_type,
         }
 
-        # Add description if available
-        if parameter.description:
-            prop["description"] = parameter.description
+        if description:
+            prop["description"] = description
+
+        if default is not None:
+            prop["default"] = default
 
-        # Add default value if available
-        if parameter.default is not None:
-            prop["default"] = parameter.default
+        if example is not None:
+            prop["example"] = example
 
-        # Add example if available
-        if parameter.example is not None:
-            prop["example"] = parameter.example
+        if key is not None:
+            self._property_cache[key] = prop
 
         return prop
 
@@ -212,45 +254,90 @@ class SchemaConverter:
         Convert a CanonicalSchema to JSON Schema.
 
         This handles complex schemas including nested objects and arrays.
+        The walk uses an explicit stack rather than recursion, so deeply
+        nested schemas convert without per-level Python frames or
+        RecursionError.
 
         Args:
             schema: Canonical schema
 
         Returns:
             JSON Schema representation
+
+        Note:
+            Results are cached per schema instance and the same dict may be
+            returned for repeated conversions - callers must not mutate it.
+        """
+        root, created = self._convert_shallow(schema)
+        if not created:
+            return root
+
+        stack = [(schema, root)]
+
+        while stack:
+            node, node_out = stack.pop()
+            json_type = node_out["type"]
+
+            # Handle object type with properties
+            node_properties = node.properties
+            if json_type == "object" and node_properties:
+                properties = {}
+                for prop_name, prop_schema in node_properties.items():
+                    child_out, child_created = self._convert_shallow(prop_schema)
+                    if child_created:
+                        stack.append((prop_schema, child_out))
+                    properties[prop_name] = child_out
+                node_out["properties"] = properties
+
+                # Add required fields
+                required = node.required
+                if required:
+                    node_out["required"] = required
+
+            # Handle array type with items
+            items = node.items
+            if json_type == "array" and items:
+                child_out, child_created = self._convert_shallow(items)
+                if child_created:
+                    stack.append((items, child_out))
+                node_out["items"] = child_out
+
+            # Add example if available (after children, preserving the
+            # historical key order of the emitted schema)
+            example = node.example
+            if example is not None:
+                node_out["example"] = example
+
+        return root
+
+    def _convert_shallow(self, schema: CanonicalSchema) -> tuple:
+        """
+        Build (and cache) the JSON Schema dict for a single node, without
+        its children.
+
+        Returns:
+            (json_schema_dict, created) - created is False on a cache hit,
+            in which case the dict is already fully populated (or queued to
+            be by an in-progress walk).
         """
-        # Get base type
+        cached = self._schema_cache.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1], False
+
+        # Get base type (single dict lookup - see _parameter_to_property)
         schema_type = schema.type
-        if isinstance(schema_type, DataType):
-            json_type = self.TYPE_MAPPING.get(schema_type, "string")
-        else:
+        json_type = self.TYPE_MAPPING.get(schema_type)
+        if json_type is None:
             json_type = str(schema_type)
 
         json_schema = {
             "type": json_type,
         }
 
-        # Add description if available
-        if schema.description:
-            json_schema["description"] = schema.description
-
-        # Handle object type with properties
-        if json_type == "object" and schema.properties:
-            properties = {}
-            for prop_name, prop_schema in schema.properties.items():
-                properties[prop_name] = self.canonical_schema_to_json_schema(prop_schema)
-            json_schema["properties"] = properties
-
-            # Add required fields
-            if schema.required:
-                json_schema["required"] = schema.required
-
-        # Handle array type with items
-        if json_type == "array" and schema.items:
-            json_schema["items"] = self.canonical_schema_to_json_schema(schema.items)
+        description = schema.description
+        if description:
+            json_schema["description"] = description
 
-        # Add example if available
-        if schema.example is not None:
-            json_schema["example"] = schema.example
+        self._schema_cache[id(schema)] = (schema, json_schema)
 
-        return json_schema
+        return json_schema, True
@@ -10,31 +10,52 @@ MCP tools follow a specific format with:
 - inputSchema: JSON Schema defining the expected inputs
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..parsing.canonical_models import CanonicalEndpoint
 from .schema_converter import SchemaConverter
 
 
-@dataclass
+def _normalize_auth_param(name: str) -> str:
+    """
+    Normalize an auth parameter name: lowercase + hyphens to underscores.
+
+    This matches how the Normalizer converts parameter names.
+    """
+    return name.lower().replace('-', '_')
+
+
+@dataclass(slots=True)
 class MCPTool:
     """
     Represents an MCP tool definition.
 
     This is the final format that gets sent to MCP-compatible LLM agents.
+    Slots keep per-instance memory down - large specs generate thousands
+    of these - and make attribute access slightly faster.
 
     Attributes:
         name: Unique tool identifier (snake_case)
         description: Human-readable description
         inputSchema: JSON Schema for tool inputs
         metadata: Additional metadata (method, path, tags, etc.)
+        tags: Tags from metadata, extracted once at construction
+        method: HTTP method from metadata, extracted once at construction
     """
 
     name: str
     description: str
     inputSchema: Dict[str, Any]
     metadata: Optional[Dict[str, Any]] = None
+    tags: Tuple[str, ...] = field(init=False, default=())
+    method: Optional[str] = field(init=False, default=None)
+
+    def __post_init__(self):
+        """Extract frequently filtered metadata fields into plain attributes."""
+        if self.metadata:
+            self.tags = tuple(self.metadata.get("tags") or ())
+            self.method = self.metadata.get("method")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert tool to dictionary format for JSON serialization."""
@@ -132,22 +153,25 @@ class ToolGenerator:
         self.api_name = api_name
         self.schema_converter = SchemaConverter()
 
-        # Determine which auth parameters to filter
-        # Normalize all auth param names: lowercase + convert hyphens to underscores
-        # This matches how the Normalizer converts parameter names
-        def normalize_auth_param(name: str) -> str:
-            return name.lower().replace('-', '_')
+        # Memoizes unfiltered generate_tools by endpoint-list identity:
+        # scripts that build several servers/registries from one normalized
+        # spec generate the tools once. The list is pinned in the entry so
+        # its id() cannot be recycled (same pattern as SchemaConverter).
+        self._tools_cache: Dict[int, Any] = {}
 
+        # Determine which auth parameters to filter
         if auth_params is not None:
             # User provided explicit override - use only those
-            self.auth_params = {normalize_auth_param(p) for p in auth_params}
+            self.auth_params = {_normalize_auth_param(p) for p in auth_params}
         else:
             # Start with defaults
-            self.auth_params = {normalize_auth_param(p) for p in self.DEFAULT_AUTH_PARAMS}
+            self.auth_params = {_normalize_auth_param(p) for p in self.DEFAULT_AUTH_PARAMS}
 
             # Merge with auto-detected params from OpenAPI security schemes
             if auto_detected_auth_params:
-                self.auth_params.update(normalize_auth_param(p) for p in auto_detected_auth_params)
+                self.auth_params.update(
+                    _normalize_auth_param(p) for p in auto_detected_auth_params
+                )
 
     def generate_tools(
         self,
@@ -192,6 +216,15 @@ class ToolGenerator:
         """
         import re
 
+        # Unfiltered generation is a pure function of the endpoint list -
+        # serve repeats from the identity cache (callers must not mutate
+        # the returned list)
+        unfiltered = limit is None and path_pattern is None and method_filter is None
+        if unfiltered:
+            cached = self._tools_cache.get(id(endpoints))
+            if cached is not None and cached[0] is endpoints:
+                return cached[1]
+
         tools = []
         count = 0
 
@@ -225,6 +258,9 @@ class ToolGenerator:
             if limit is not None and count >= limit:
                 break
 
+        if unfiltered:
+            self._tools_cache[id(endpoints)] = (endpoints, tools)
+
         return tools
 
     def generate_tool(
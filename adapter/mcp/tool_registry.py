@@ -9,6 +9,11 @@ import json
 import re
 from typing import Any, Dict, List, Optional, Set, Pattern
 
+try:  # Optional fast JSON backend (install with the "speed" extra)
+    import orjson
+except ImportError:
+    orjson = None
+
 from .tool_generator import MCPTool
 from ..parsing.canonical_models import CanonicalEndpoint
 
@@ -56,6 +61,15 @@ class ToolRegistry:
         self._tools: Dict[str, MCPTool] = {}
         self._endpoints: Dict[str, CanonicalEndpoint] = {}
 
+        # Inverted indexes (tag/method -> tool names, in insertion order) so
+        # tag and method lookups avoid scanning every tool
+        self._by_tag: Dict[str, List[str]] = {}
+        self._by_method: Dict[str, List[str]] = {}
+
+        # Lowercased name+description per tool, computed once at insert so
+        # search_tools doesn't re-lower every tool on every query
+        self._search_blob: Dict[str, str] = {}
+
         if endpoints:
             self.set_endpoints(endpoints)
 
@@ -76,19 +90,72 @@ class ToolRegistry:
             )
 
         self._tools[tool.name] = tool
+        self._index_tool(tool)
+
+    def _index_tool(self, tool: MCPTool) -> None:
+        """Add a tool to the tag, method, and search indexes."""
+        # NUL separator so a query can never straddle the name/description
+        # boundary
+        self._search_blob[tool.name] = (
+            f"{tool.name}\x00{tool.description or ''}".lower()
+        )
+
+        for tag in tool.tags:
+            self._by_tag.setdefault(tag, []).append(tool.name)
+
+        if tool.method:
+            self._by_method.setdefault(tool.method, []).append(tool.name)
+
+    def _unindex_tool(self, tool: MCPTool) -> None:
+        """Remove a tool from the tag, method, and search indexes."""
+        self._search_blob.pop(tool.name, None)
+
+        for tag in tool.tags:
+            names = self._by_tag.get(tag)
+            if names and tool.name in names:
+                names.remove(tool.name)
+                if not names:
+                    del self._by_tag[tag]
+
+        if tool.method:
+            names = self._by_method.get(tool.method)
+            if names and tool.name in names:
+                names.remove(tool.name)
+                if not names:
+                    del self._by_method[tool.method]
 
     def add_tools(self, tools: List[MCPTool]) -> None:
         """
         Add multiple tools to the registry.
 
+        All duplicate checks run up front, so either every tool is added or
+        none are - a failure partway through cannot leave the registry in a
+        half-populated state.
+
         Args:
             tools: List of MCP tools to add
 
         Raises:
             ValueError: If any tool name already exists
         """
-        for tool in tools:
-            self.add_tool(tool)
+        new_tools = {tool.name: tool for tool in tools}
+
+        conflicts = new_tools.keys() & self._tools.keys()
+        if conflicts:
+            raise ValueError(
+                f"Tools already exist in registry: {sorted(conflicts)}. "
+                f"Use update_tool() to modify existing tools."
+            )
+        if len(new_tools) != len(tools):
+            seen = set()
+            duplicates = sorted(
+                {t.name for t in tools if t.name in seen or seen.add(t.name)}
+            )
+            raise ValueError(f"Duplicate tool names in batch: {duplicates}")
+
+        self._tools.update(new_tools)
+        for tool in new_tools.values():
+            self._index_tool(tool)
 
     def update_tool(self, tool: MCPTool) -> None:
         """
@@ -106,7 +173,9 @@ class ToolRegistry:
                 f"Use add_tool() to add new tools."
             )
 
+        self._unindex_tool(self._tools[tool.name])
         self._tools[tool.name] = tool
+        self._index_tool(tool)
 
     def get_tool(self, name: str) -> Optional[MCPTool]:
         """
@@ -155,15 +224,11 @@ class ToolRegistry:
         Returns:
             List of tools with the tag (limited if specified)
         """
-        tools = []
-        for tool in self._tools.values():
-            if tool.metadata and "tags" in tool.metadata:
-                if tag in tool.metadata["tags"]:
-                    tools.append(tool)
-                    if limit is not None and len(tools) >= limit:
-                        break
+        names = self._by_tag.get(tag, ())
+        if limit is not None:
+            names = names[:limit]
 
-        return tools
+        return [self._tools[name] for name in names]
 
     def get_tools_by_method(self, method: str, limit: Optional[int] = None) -> List[MCPTool]:
         """
@@ -176,16 +241,11 @@ class ToolRegistry:
         Returns:
             List of tools with the method (limited if specified)
         """
-        method = method.upper()
-        tools = []
+        names = self._by_method.get(method.upper(), ())
+        if limit is not None:
+            names = names[:limit]
 
-        for tool in self._tools.values():
-            if tool.metadata and tool.metadata.get("method") == method:
-                tools.append(tool)
-                if limit is not None and len(tools) >= limit:
-                    break
-
-        return tools
+        return [self._tools[name] for name in names]
 
     def search_tools(self, query: str, limit: Optional[int] = None) -> List[MCPTool]:
         """
@@ -201,20 +261,11 @@ class ToolRegistry:
         query_lower = query.lower()
         tools = []
 
-        for tool in self._tools.values():
-            # Search in name
-            if query_lower in tool.name.lower():
-                tools.append(tool)
-                if limit is not None and len(tools) >= limit:
-                    break
-                continue
-
-            # Search in description
-            if query_lower in tool.description.lower():
-                tools.append(tool)
+        for name, blob in self._search_blob.items():
+            if query_lower in blob:
+                tools.append(self._tools[name])
                 if limit is not None and len(tools) >= limit:
                     break
-                continue
 
         return tools
 
@@ -343,14 +394,11 @@ class ToolRegistry:
         # Filter by method
         if method:
             method = method.upper()
-            tools = [t for t in tools if t.metadata and t.metadata.get("method") == method]
+            tools = [t for t in tools if t.method == method]
 
         # Filter by tag
         if tag:
-            tools = [
-                t for t in tools
-                if t.metadata and "tags" in t.metadata and tag in t.metadata["tags"]
-            ]
+            tools = [t for t in tools if tag in t.tags]
 
         # Filter by pattern
         if pattern:
@@ -394,13 +442,7 @@ class ToolRegistry:
         Returns:
             Set of all tags
         """
-        tags = set()
-
-        for tool in self._tools.values():
-            if tool.metadata and "tags" in tool.metadata:
-                tags.update(tool.metadata["tags"])
-
-        return tags
+        return set(self._by_tag)
 
     def remove_tool(self, name: str) -> bool:
         """
@@ -412,7 +454,9 @@ class ToolRegistry:
         Returns:
             True if tool was removed, False if not found
         """
-        if name in self._tools:
+        tool = self._tools.get(name)
+        if tool is not None:
+            self._unindex_tool(tool)
             del self._tools[name]
             return True
         return False
@@ -420,6 +464,9 @@ class ToolRegistry:
     def clear(self) -> None:
         """Remove all tools from the registry."""
         self._tools.clear()
+        self._by_tag.clear()
+        self._by_method.clear()
+        self._search_blob.clear()
 
     def count(self) -> int:
         """
@@ -461,6 +508,11 @@ class ToolRegistry:
         Returns:
             JSON string representation
         """
+        # orjson only supports 2-space indentation; anything else keeps the
+        # stdlib path so the output format never changes behind the caller
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_INDENT_2 if indent == 2 else 0
+            return orjson.dumps(self.to_dict(), option=option).decode("utf-8")
         return json.dumps(self.to_dict(), indent=indent)
 
     def export_json(self, file_path: str, indent: int = 2) -> None:
@@ -474,8 +526,16 @@ class ToolRegistry:
         Examples:
             >>> registry.export_json("tools.json")
         """
+        # orjson serializes straight to UTF-8 bytes, skipping both the str
+        # build and the encode step; for other indents, stream via stdlib
+        # json.dump instead of building the full string in memory
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_INDENT_2 if indent == 2 else 0
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(self.to_dict(), option=option))
+            return
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(self.to_json(indent=indent))
+            json.dump(self.to_dict(), f, indent=indent)
 
     def export_tools_only(self, file_path: str, indent: int = 2) -> None:
         """
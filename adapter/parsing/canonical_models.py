@@ -8,10 +8,11 @@ The canonical format ensures consistency and enables straightforward conversion
 to MCP tool definitions in later phases.
 """
 
+import sys
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class DataType(str, Enum):
@@ -65,10 +66,27 @@ class CanonicalSchema(BaseModel):
         description="Example value",
     )
 
-    class Config:
-        """Pydantic configuration."""
+    # Native ConfigDict skips pydantic's class-Config compatibility shim at
+    # class creation; frozen instances also skip __setattr__ validation.
+    # defer_build postpones core-schema construction to the explicit
+    # model_rebuild below, so the recursive schema is only built once.
+    model_config = ConfigDict(use_enum_values=True, frozen=True, defer_build=True)
 
-        use_enum_values = True
+    @classmethod
+    def build_trusted(cls, **fields: Any) -> "CanonicalSchema":
+        """
+        Construct without validation from already-normalized internal data.
+
+        Bypasses the validator chain via model_construct for hot-path
+        construction (one schema node per property of every ingested
+        endpoint). Callers must uphold the field invariants themselves;
+        external/user-provided data should use the normal constructor.
+        """
+        schema_type = fields.get("type")
+        if isinstance(schema_type, DataType):
+            # Mirror use_enum_values, which only runs during validation
+            fields["type"] = schema_type.value
+        return cls.model_construct(**fields)
 
 
 class CanonicalParameter(BaseModel):
@@ -104,12 +122,28 @@ class CanonicalParameter(BaseModel):
         """Ensure parameter names are in snake_case."""
         if not v:
             raise ValueError("Parameter name cannot be empty")
-        return v.strip()
+        # Intern: names like 'symbol' or 'limit' recur thousands of times
+        # across a spec, so repeated parameters share one str object
+        return sys.intern(v.strip())
 
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
-        use_enum_values = True
+    @classmethod
+    def build_trusted(cls, **fields: Any) -> "CanonicalParameter":
+        """
+        Construct without validation from already-normalized internal data.
+
+        Callers must supply a non-empty, stripped name; enum fields are
+        stored as plain values to mirror use_enum_values. External/
+        user-provided data should use the normal constructor.
+        """
+        location = fields.get("location")
+        if isinstance(location, ParameterLocation):
+            fields["location"] = location.value
+        param_type = fields.get("type")
+        if isinstance(param_type, DataType):
+            fields["type"] = param_type.value
+        return cls.model_construct(**fields)
 
 
 class CanonicalEndpoint(BaseModel):
@@ -203,11 +237,25 @@ class CanonicalEndpoint(BaseModel):
             raise ValueError("Endpoint name cannot be empty")
         return v.strip()
 
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
-        use_enum_values = True
-
-
-# Enable forward references for recursive schemas
-CanonicalSchema.model_rebuild()
+    @classmethod
+    def build_trusted(cls, **fields: Any) -> "CanonicalEndpoint":
+        """
+        Construct without validation from already-normalized internal data.
+
+        Callers must uphold the field-validator invariants themselves:
+        non-empty stripped name, uppercase method, and a path starting
+        with '/'. External/user-provided data should use the normal
+        constructor.
+        """
+        return cls.model_construct(**fields)
+
+
+# Enable forward references for recursive schemas. The explicit namespace
+# resolves the "CanonicalSchema" string refs directly instead of letting
+# pydantic walk parent frames/modules at import time; force=True performs
+# the one (deferred) core-schema build.
+CanonicalSchema.model_rebuild(
+    force=True, _types_namespace={"CanonicalSchema": CanonicalSchema}
+)
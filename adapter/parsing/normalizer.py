@@ -19,6 +19,7 @@ The normalizer is designed to handle:
 
 import re
 import logging
+import sys
 from typing import Any, Dict, List, Optional
 
 from .canonical_models import (
@@ -31,6 +32,18 @@ from .canonical_models import (
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the hot normalization paths. re caches compiled
+# patterns internally, but hoisting them avoids the per-call cache lookup.
+_PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+
+# HTTP methods that map to operations in an OpenAPI path item. Other keys
+# (parameters, summary, $ref, ...) are not operations.
+_OPERATION_METHODS = frozenset(
+    ("get", "post", "put", "delete", "patch", "head", "options")
+)
+
 
 class Normalizer:
     """
@@ -54,6 +67,14 @@ class Normalizer:
         >>> endpoint = normalizer.normalize_endpoint(raw_endpoint)
     """
 
+    def __init__(self):
+        """Initialize the normalizer with an empty result cache."""
+        # Memoizes normalize_openapi by spec identity: callers that thread
+        # the same loaded spec dict through several passes normalize once.
+        # The spec itself is stored alongside the result so its id() cannot
+        # be recycled while cached (same pattern as SchemaConverter).
+        self._result_cache: Dict[int, Any] = {}
+
     # Type mapping from OpenAPI/JSON Schema to canonical types
     TYPE_MAPPING = {
         "string": DataType.STRING,
@@ -92,10 +113,18 @@ class Normalizer:
         Example:
             >>> spec = {"paths": {"/users": {"get": {...}}}}
             >>> endpoints = normalizer.normalize_openapi(spec)
+
+        Note:
+            Results are cached per spec instance and the same list may be
+            returned for repeated calls - callers must not mutate it.
         """
+        cached = self._result_cache.get(id(spec))
+        if cached is not None and cached[0] is spec:
+            return cached[1]
+
         endpoints = []
 
-        paths = spec.get("paths", {})
+        paths = spec.get("paths")
         if not isinstance(paths, dict):
             return endpoints
 
@@ -107,12 +136,13 @@ class Normalizer:
             if not isinstance(path_item, dict):
                 continue
 
-            # Process each HTTP method
-            for method in ["get", "post", "put", "delete", "patch", "head", "options"]:
-                if method not in path_item:
+            # Process each HTTP method. Iterating the path item's own keys
+            # only touches the 1-2 methods typically present instead of
+            # probing all seven; endpoints follow the spec's declared order.
+            for method, operation in path_item.items():
+                if method not in _OPERATION_METHODS:
                     continue
 
-                operation = path_item[method]
                 if not isinstance(operation, dict):
                     continue
 
@@ -126,6 +156,8 @@ class Normalizer:
 
                 endpoints.append(endpoint)
 
+        self._result_cache[id(spec)] = (spec, endpoints)
+
         return endpoints
 
     def _extract_base_info(self, spec: Dict[str, Any]) -> Dict[str, Any]:
@@ -216,7 +248,13 @@ class Normalizer:
         # Check if deprecated
         deprecated = operation.get("deprecated", False)
 
-        return CanonicalEndpoint(
+        # Uphold the path invariant here so the trusted constructor below
+        # can skip the validator chain (one endpoint per operation)
+        path = path.strip()
+        if not path.startswith("/"):
+            path = f"/{path}"
+
+        return CanonicalEndpoint.build_trusted(
             name=name,
             method=method.upper(),
             path=path,
@@ -261,7 +299,7 @@ class Normalizer:
         name_parts = [method] + path_parts
 
         # Handle path parameters
-        param_match = re.findall(r"\{(\w+)\}", path)
+        param_match = _PATH_PARAM_RE.findall(path)
         if param_match:
             name_parts.append("by")
             name_parts.extend(param_match)
@@ -332,10 +370,12 @@ class Normalizer:
                 location, ParameterLocation.QUERY
             )
 
-            # Create parameter (wrap in try-catch for additional safety)
+            # Create parameter via the trusted fast path - name, location
+            # and type invariants were all enforced above (wrap in
+            # try-catch for additional safety)
             try:
                 normalized.append(
-                    CanonicalParameter(
+                    CanonicalParameter.build_trusted(
                         name=normalized_name,
                         location=normalized_location,
                         type=param_type,
@@ -401,14 +441,17 @@ class Normalizer:
         if "items" in schema:
             items = self._normalize_schema(schema["items"])
 
-        # Required fields
+        # Required fields (guard the type since the trusted constructor
+        # below won't coerce malformed input)
         required = schema.get("required", [])
+        if not isinstance(required, list):
+            required = []
 
         # Description and example
         description = schema.get("description")
         example = schema.get("example")
 
-        return CanonicalSchema(
+        return CanonicalSchema.build_trusted(
             type=schema_type,
             properties=properties,
             items=items,
@@ -456,15 +499,19 @@ class Normalizer:
         text = text.replace("-", "_").replace(" ", "_")
 
         # Insert underscore before uppercase letters (camelCase/PascalCase)
-        text = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", text)
+        text = _CAMEL_BOUNDARY_RE.sub(r"\1_\2", text)
 
         # Convert to lowercase
         text = text.lower()
 
         # Remove multiple consecutive underscores
-        text = re.sub(r"_+", "_", text)
+        text = _MULTI_UNDERSCORE_RE.sub("_", text)
 
         # Remove leading/trailing underscores
         text = text.strip("_")
 
-        return text
+        # Intern the result: parameter names and property keys recur heavily
+        # both within and across specs ('symbol', 'limit', 'timestamp', ...),
+        # so repeats share a single str object and downstream == compares
+        # short-circuit on identity
+        return sys.intern(text)
@@ -14,11 +14,25 @@ Or use these helper functions for quick prototyping:
     >>> spec = load_openapi("https://api.example.com/openapi.json")
 """
 
+import functools
 from typing import Any, Dict
 
 from ..ingestion import OpenAPILoader
 
 
+@functools.lru_cache(maxsize=4)
+def _get_loader(strict: bool, use_langchain: bool) -> OpenAPILoader:
+    """
+    Return a shared OpenAPILoader for the given configuration.
+
+    Loaders are stateless with respect to load(content), so batch callers
+    of load_openapi() reuse one instance per configuration instead of
+    reconstructing the loader (and re-resolving its optional integrations)
+    on every call.
+    """
+    return OpenAPILoader(strict=strict, use_langchain=use_langchain)
+
+
 def load_openapi(
     source: str,
     strict: bool = False,
@@ -51,5 +65,4 @@ def load_openapi(
         >>> # With strict validation
         >>> spec = load_openapi("api.yaml", strict=True)
     """
-    loader = OpenAPILoader(strict=strict, use_langchain=use_langchain)
-    return loader.load(source)
+    return _get_loader(strict, use_langchain).load(source)
@@ -10,8 +10,10 @@ import json
 import logging
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError
 
 from ..parsing.canonical_models import CanonicalEndpoint
@@ -21,6 +23,26 @@ from .response import ResponseProcessor, ProcessedResponse
 
 logger = logging.getLogger(__name__)
 
+# Immutable default - shared across instances instead of rebuilt per __init__
+DEFAULT_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# One pooled Session per host, shared by every executor in the process, so
+# TCP+TLS handshakes happen once per host instead of once per request
+_SESSION_POOL: Dict[str, requests.Session] = {}
+
+
+def _session_for(url: str) -> requests.Session:
+    """Return the shared, connection-pooled Session for the URL's host."""
+    host = urlparse(url).netloc
+    session = _SESSION_POOL.get(host)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION_POOL[host] = session
+    return session
+
 
 @dataclass
 class ExecutionResult:
@@ -123,11 +145,14 @@ class APIExecutor:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
-        self.retry_on_status_codes = retry_on_status_codes or [429, 500, 502, 503, 504]
+        self.retry_on_status_codes = retry_on_status_codes or DEFAULT_RETRY_STATUS_CODES
 
         self.request_builder = RequestBuilder(base_url=base_url)
         self.response_processor = ResponseProcessor()
 
+        # Resolve the shared session once when the host is known up front
+        self._session = _session_for(base_url) if base_url else None
+
     def execute(
         self,
         endpoint: CanonicalEndpoint,
@@ -184,16 +209,17 @@ class APIExecutor:
         requires_auth = endpoint.security and len(endpoint.security) > 0
 
         if requires_auth:
-            logger.debug(f"Endpoint requires authentication: {endpoint.name}")
+            logger.debug("Endpoint requires authentication: %s", endpoint.name)
             self.auth.apply(headers, query_params)
         else:
-            logger.debug(f"Endpoint is public (no auth required): {endpoint.name}")
+            logger.debug("Endpoint is public (no auth required): %s", endpoint.name)
 
-        # Log request details for debugging
-        logger.debug(f"Request URL: {request_details['url']}")
-        logger.debug(f"Request Method: {request_details['method']}")
-        logger.debug(f"Request Headers: {headers}")
-        logger.debug(f"Request Body: {request_details['body']}")
+        # Log request details for debugging (lazy %-formatting so headers
+        # and bodies are only stringified when DEBUG is enabled)
+        logger.debug("Request URL: %s", request_details["url"])
+        logger.debug("Request Method: %s", request_details["method"])
+        logger.debug("Request Headers: %s", headers)
+        logger.debug("Request Body: %s", request_details["body"])
 
         # Execute with retries
         for attempt in range(1, self.max_retries + 1):
@@ -310,26 +336,42 @@ class APIExecutor:
             else:
                 kwargs["data"] = body
 
-        # Execute request
-        return requests.request(method=method, url=url, **kwargs)
+        # Execute on the shared per-host session (connection reuse)
+        session = self._session or _session_for(url)
+        return session.request(method=method, url=url, **kwargs)
 
     def execute_batch(
         self,
         calls: list,
+        max_workers: Optional[int] = None,
     ) -> list:
         """
-        Execute multiple API calls in sequence.
+        Execute multiple API calls.
+
+        Batch execution is network-bound, so calls can run concurrently on
+        a thread pool: total latency approaches the slowest call instead of
+        the sum of round trips. Results keep the order of the input calls.
 
         Args:
             calls: List of (endpoint, parameters) tuples
+            max_workers: Number of concurrent requests. None or 1 executes
+                sequentially (the historical behavior).
 
         Returns:
-            List of execution results
+            List of execution results (same order as calls)
         """
-        results = []
-
-        for endpoint, parameters in calls:
-            result = self.execute(endpoint=endpoint, parameters=parameters)
-            results.append(result)
-
-        return results
+        if max_workers is None or max_workers <= 1 or len(calls) <= 1:
+            return [
+                self.execute(endpoint=endpoint, parameters=parameters)
+                for endpoint, parameters in calls
+            ]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+            return list(
+                pool.map(
+                    lambda call: self.execute(endpoint=call[0], parameters=call[1]),
+                    calls,
+                )
+            )
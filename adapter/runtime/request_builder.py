@@ -6,11 +6,20 @@ construction, and request body formatting.
 """
 
 import json
+import re
 from typing import Any, Dict, Optional, List
 from urllib.parse import urlencode
 
 from ..parsing.canonical_models import CanonicalEndpoint, ParameterLocation
 
+# Precompiled pattern for {param} placeholders in URL paths
+_PATH_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Path templates split once per distinct path and shared across builders.
+# re.split with the capturing group yields alternating literal/param-name
+# pieces: ["/users/", "user_id", ""], so URL building is pure string joins.
+_TEMPLATE_CACHE: Dict[str, tuple] = {}
+
 
 class RequestBuilderError(Exception):
     """Error raised when building a request fails."""
@@ -180,25 +189,36 @@ class RequestBuilder:
         Raises:
             RequestBuilderError: If required path parameters are missing
         """
-        # Substitute path parameters
-        url_path = path
-        for param_name, param_value in path_params.items():
-            placeholder = f"{{{param_name}}}"
-            if placeholder not in url_path:
+        # Resolve the path's precomputed template (literal/name pieces)
+        pieces = _TEMPLATE_CACHE.get(path)
+        if pieces is None:
+            pieces = tuple(_PATH_PLACEHOLDER_RE.split(path))
+            _TEMPLATE_CACHE[path] = pieces
+
+        param_names = pieces[1::2]
+
+        for param_name in path_params:
+            if param_name not in param_names:
                 raise RequestBuilderError(
                     f"Path parameter '{param_name}' not found in path '{path}'"
                 )
-            url_path = url_path.replace(placeholder, str(param_value))
-
-        # Check for unsubstituted placeholders
-        import re
 
-        remaining_placeholders = re.findall(r"\{(\w+)\}", url_path)
-        if remaining_placeholders:
+        missing = [name for name in param_names if name not in path_params]
+        if missing:
             raise RequestBuilderError(
-                f"Missing required path parameters: {', '.join(remaining_placeholders)}"
+                f"Missing required path parameters: {', '.join(missing)}"
             )
 
+        if param_names:
+            # Fill the parameter slots (odd indices) and join - no regex or
+            # repeated str.replace scans per request
+            parts = list(pieces)
+            for i in range(1, len(parts), 2):
+                parts[i] = str(path_params[parts[i]])
+            url_path = "".join(parts)
+        else:
+            url_path = path
+
         # Combine with base URL if provided
         if self.base_url:
             # Ensure path starts with /
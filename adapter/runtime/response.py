@@ -8,6 +8,10 @@ import json
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
 
+# Immutable default shared across instances; frozenset makes the per-response
+# status-code membership test an O(1) hash lookup instead of a 100-entry scan
+DEFAULT_SUCCESS_CODES = frozenset(range(200, 300))
+
 
 @dataclass
 class ProcessedResponse:
@@ -72,7 +76,9 @@ class ResponseProcessor:
                           (default: 200-299)
             auto_parse_json: Automatically parse JSON responses
         """
-        self.success_codes = success_codes or list(range(200, 300))
+        self.success_codes = (
+            frozenset(success_codes) if success_codes else DEFAULT_SUCCESS_CODES
+        )
         self.auto_parse_json = auto_parse_json
 
     def process(self, response: Any) -> ProcessedResponse:
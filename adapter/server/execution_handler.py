@@ -89,7 +89,7 @@ class ExecutionHandler:
                     self._tool_endpoint_map[tool.name] = endpoint
                     break
 
-        logger.debug(f"Built tool→endpoint map with {len(self._tool_endpoint_map)} entries")
+        logger.debug("Built tool→endpoint map with %d entries", len(self._tool_endpoint_map))
 
     def execute_tool(
         self, tool_name: str, arguments: Dict[str, Any]
@@ -116,8 +116,8 @@ class ExecutionHandler:
         Raises:
             ValueError: If tool not found or execution fails
         """
-        logger.info(f"Executing tool: {tool_name}")
-        logger.debug(f"Arguments: {arguments}")
+        logger.info("Executing tool: %s", tool_name)
+        logger.debug("Arguments: %s", arguments)
 
         # Get the tool
         tool = self.tool_provider.get_tool(tool_name)
@@ -148,7 +148,7 @@ class ExecutionHandler:
                 )
 
         except Exception as e:
-            logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
+            logger.error("Error executing tool %s: %s", tool_name, e, exc_info=True)
             return self._create_error_result(str(e))
 
     def _create_success_result(self, execution_result) -> Dict[str, Any]:
@@ -111,8 +111,8 @@ class MCPServer:
         # Server state
         self.initialized = False
 
-        logger.info(f"MCPServer '{name}' v{version} created")
-        logger.info(f"Available tools: {self.tool_provider.get_tool_count()}")
+        logger.info("MCPServer %r v%s created", name, version)
+        logger.info("Available tools: %d", self.tool_provider.get_tool_count())
 
     def run(self):
         """
@@ -157,11 +157,11 @@ class MCPServer:
                 )
             return None
 
-        logger.debug(f"Handling method: {method} (notification: {is_notification})")
+        logger.debug("Handling method: %s (notification: %s)", method, is_notification)
 
         # Handle notifications (don't send response)
         if method.startswith("notifications/"):
-            logger.debug(f"Received notification: {method}")
+            logger.debug("Received notification: %s", method)
             # Handle notification but don't respond
             if method == "notifications/initialized":
                 logger.info("Client initialized")
@@ -194,7 +194,7 @@ class MCPServer:
             return None
 
         except Exception as e:
-            logger.error(f"Error handling {method}: {e}", exc_info=True)
+            logger.error("Error handling %s: %s", method, e, exc_info=True)
             if not is_notification:
                 return self._create_error_response(
                     message_id=message_id,
@@ -267,7 +267,7 @@ class MCPServer:
         if not tool_name:
             raise ValueError("Missing required parameter: name")
 
-        logger.info(f"Handling tools/call request for: {tool_name}")
+        logger.info("Handling tools/call request for: %s", tool_name)
 
         result = self.execution_handler.execute_tool(
             tool_name=tool_name, arguments=arguments
@@ -43,7 +43,7 @@ class ToolProvider:
             tool_registry: ToolRegistry containing MCP tools
         """
         self.registry = tool_registry
-        logger.info(f"ToolProvider initialized with {tool_registry.count()} tools")
+        logger.info("ToolProvider initialized with %d tools", tool_registry.count())
 
     def list_tools(self) -> List[Dict[str, Any]]:
         """
@@ -70,7 +70,7 @@ class ToolProvider:
 
             tools.append(tool_dict)
 
-        logger.debug(f"Listed {len(tools)} tools")
+        logger.debug("Listed %d tools", len(tools))
         return tools
 
     def get_tool(self, tool_name: str) -> Optional[MCPTool]:
@@ -86,9 +86,9 @@ class ToolProvider:
         tool = self.registry.get_tool(tool_name)
 
         if tool:
-            logger.debug(f"Found tool: {tool_name}")
+            logger.debug("Found tool: %s", tool_name)
         else:
-            logger.warning(f"Tool not found: {tool_name}")
+            logger.warning("Tool not found: %s", tool_name)
 
         return tool
 
@@ -112,7 +112,7 @@ class ToolProvider:
             List of matching tools
         """
         results = self.registry.search_tools(query)
-        logger.debug(f"Search for '{query}' returned {len(results)} results")
+        logger.debug("Search for %r returned %d results", query, len(results))
         return results
 
     def get_tools_by_tag(self, tag: str) -> List[MCPTool]:
@@ -126,7 +126,7 @@ class ToolProvider:
             List of tools with the specified tag
         """
         results = self.registry.get_tools_by_tag(tag)
-        logger.debug(f"Found {len(results)} tools with tag '{tag}'")
+        logger.debug("Found %d tools with tag %r", len(results), tag)
         return results
 
     def get_tool_metadata(self, tool_name: str) -> Optional[Dict[str, Any]]:
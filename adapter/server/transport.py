@@ -61,7 +61,7 @@ class StdioTransport:
                 try:
                     # Parse JSON-RPC message
                     message = json.loads(line)
-                    logger.debug(f"Received message: {message}")
+                    logger.debug("Received message: %s", message)
 
                     # Process message
                     response = message_handler(message)
@@ -71,7 +71,7 @@ class StdioTransport:
                         self.send_message(response)
 
                 except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON received: {e}")
+                    logger.error("Invalid JSON received: %s", e)
                     # Send error response
                     error_response = self._create_error_response(
                         message_id=None,
@@ -82,7 +82,7 @@ class StdioTransport:
                     self.send_message(error_response)
 
                 except Exception as e:
-                    logger.error(f"Error processing message: {e}", exc_info=True)
+                    logger.error("Error processing message: %s", e, exc_info=True)
                     # Send internal error response
                     error_response = self._create_error_response(
                         message_id=None,
@@ -108,9 +108,9 @@ class StdioTransport:
             json_str = json.dumps(message)
             sys.stdout.write(json_str + "\n")
             sys.stdout.flush()
-            logger.debug(f"Sent message: {message}")
+            logger.debug("Sent message: %s", message)
         except Exception as e:
-            logger.error(f"Error sending message: {e}", exc_info=True)
+            logger.error("Error sending message: %s", e, exc_info=True)
 
     def stop(self):
         """Stop the transport."""